@@ -15,20 +15,25 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import logging
+from types import ModuleType
 from types import TracebackType
 from typing import Any, Optional, TYPE_CHECKING, Union
 
 import google.auth
+from google.auth.credentials import TokenState
 from google.auth.credentials import with_scopes_if_required
 import google.auth.transport.requests
 
 import google.cloud.alloydb.connector.asyncpg as asyncpg
 from google.cloud.alloydb.connector.client import AlloyDBClient
+from google.cloud.alloydb.connector.enums import _to_ip_type
 from google.cloud.alloydb.connector.enums import IPTypes
 from google.cloud.alloydb.connector.enums import RefreshStrategy
 from google.cloud.alloydb.connector.instance import RefreshAheadCache
 from google.cloud.alloydb.connector.lazy import LazyRefreshCache
+from google.cloud.alloydb.connector.utils import _get_keys
 from google.cloud.alloydb.connector.utils import generate_keys
 
 if TYPE_CHECKING:
@@ -36,6 +41,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(name=__name__)
 
+# connection arguments derived from the instance, never taken from the user
+_RESERVED_KWARGS = ("host", "ssl", "port")
+# supported database drivers, mapped to the module providing their connect
+_DRIVERS: dict[str, ModuleType] = {"asyncpg": asyncpg}
+
 
 class AsyncConnector:
     """A class to configure and create connections to Cloud SQL instances
@@ -77,30 +87,62 @@ class AsyncConnector:
         self._alloydb_api_endpoint = alloydb_api_endpoint
         self._enable_iam_auth = enable_iam_auth
         # if ip_type is str, convert to IPTypes enum
-        if isinstance(ip_type, str):
-            ip_type = IPTypes(ip_type.upper())
-        self._ip_type = ip_type
+        self._ip_type = _to_ip_type(ip_type)
         # if refresh_strategy is str, convert to RefreshStrategy enum
         if isinstance(refresh_strategy, str):
             refresh_strategy = RefreshStrategy(refresh_strategy.upper())
         self._refresh_strategy = refresh_strategy
         self._user_agent = user_agent
         # initialize credentials
-        scopes = ["https://www.googleapis.com/auth/cloud-platform"]
+        self._scopes = ["https://www.googleapis.com/auth/cloud-platform"]
+        self._credentials: Optional[Credentials] = None
+        self._credentials_task: Optional[asyncio.Task] = None
         if credentials:
-            self._credentials = with_scopes_if_required(credentials, scopes=scopes)
-        # otherwise use application default credentials
-        else:
-            self._credentials, _ = google.auth.default(scopes=scopes)
+            self._credentials = with_scopes_if_required(
+                credentials, scopes=self._scopes
+            )
+        # otherwise application default credentials are looked up on first
+        # connect, as the lookup may perform blocking I/O
+        # transport reused for every credentials refresh
+        self._auth_request = google.auth.transport.requests.Request()
 
         # check if AsyncConnector is being initialized with event loop running
-        # Otherwise we will lazy init keys
+        # Otherwise generate keys in a separate thread so they are ready by
+        # the time the first connection is made
+        self._keys: Optional[asyncio.Future] = None
+        self._keys_future: Optional[concurrent.futures.Future] = None
         try:
-            self._keys: Optional[asyncio.Task] = asyncio.create_task(generate_keys())
+            asyncio.get_running_loop()
+            self._keys = asyncio.create_task(generate_keys())
         except RuntimeError:
-            self._keys = None
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            self._keys_future = executor.submit(_get_keys)
+            executor.shutdown(wait=False)
         self._client: Optional[AlloyDBClient] = None
 
+    async def _resolve_credentials(self) -> Credentials:
+        """Returns the credentials used by the connector.
+
+        Application default credentials are looked up in a separate thread
+        the first time they are needed so the lookup does not block the
+        event loop.
+        """
+        if self._credentials is None:
+            # concurrent first connects share a single lookup
+            if self._credentials_task is None:
+                self._credentials_task = asyncio.create_task(
+                    asyncio.to_thread(google.auth.default, scopes=self._scopes)
+                )
+            task = self._credentials_task
+            try:
+                self._credentials, _ = await asyncio.shield(task)
+            except Exception:
+                # allow a later connect to retry a failed lookup
+                if self._credentials_task is task:
+                    self._credentials_task = None
+                raise
+        return self._credentials
+
     async def connect(
         self,
         instance_uri: str,
@@ -125,14 +167,26 @@ class AsyncConnector:
         Returns:
             connection: A DBAPI connection to the specified AlloyDB instance.
         """
+        # only accept supported database drivers, before credentials are
+        # resolved, keys are generated or the client is bound to the driver
+        driver_module = _DRIVERS.get(driver)
+        if driver_module is None:
+            raise ValueError(f"Driver '{driver}' is not a supported database driver.")
+        connector = driver_module.connect
+
+        credentials = await self._resolve_credentials()
         if self._keys is None:
-            self._keys = asyncio.create_task(generate_keys())
+            if self._keys_future is not None:
+                self._keys = asyncio.wrap_future(self._keys_future)
+            else:
+                self._keys = asyncio.create_task(generate_keys())
+
         if self._client is None:
             # lazy init client as it has to be initialized in async context
             self._client = AlloyDBClient(
                 self._alloydb_api_endpoint,
                 self._quota_project,
-                self._credentials,
+                credentials,
                 user_agent=self._user_agent,
                 driver=driver,
             )
@@ -140,43 +194,31 @@ class AsyncConnector:
         enable_iam_auth = kwargs.pop("enable_iam_auth", self._enable_iam_auth)
 
         # use existing connection info if possible
-        if instance_uri in self._cache:
-            cache = self._cache[instance_uri]
-        else:
+        cache = self._cache.get(instance_uri)
+        if cache is None:
             if self._refresh_strategy == RefreshStrategy.LAZY:
                 logger.debug(
-                    f"['{instance_uri}']: Refresh strategy is set to lazy refresh"
+                    "['%s']: Refresh strategy is set to lazy refresh", instance_uri
                 )
                 cache = LazyRefreshCache(instance_uri, self._client, self._keys)
             else:
                 logger.debug(
-                    f"['{instance_uri}']: Refresh strategy is set to background"
-                    " refresh"
+                    "['%s']: Refresh strategy is set to background refresh",
+                    instance_uri,
                 )
                 cache = RefreshAheadCache(instance_uri, self._client, self._keys)
             self._cache[instance_uri] = cache
-            logger.debug(f"['{instance_uri}']: Connection info added to cache")
-
-        connect_func = {
-            "asyncpg": asyncpg.connect,
-        }
-        # only accept supported database drivers
-        try:
-            connector = connect_func[driver]
-        except KeyError:
-            raise ValueError(f"Driver '{driver}' is not a supported database driver.")
+            logger.debug("['%s']: Connection info added to cache", instance_uri)
 
         # Host and ssl options come from the certificates and instance IP
         # address so we don't want the user to specify them.
-        kwargs.pop("host", None)
-        kwargs.pop("ssl", None)
-        kwargs.pop("port", None)
+        for kwarg in _RESERVED_KWARGS:
+            kwargs.pop(kwarg, None)
 
         # get connection info for AlloyDB instance
         ip_type: str | IPTypes = kwargs.pop("ip_type", self._ip_type)
         # if ip_type is str, convert to IPTypes enum
-        if isinstance(ip_type, str):
-            ip_type = IPTypes(ip_type.upper())
+        ip_type = _to_ip_type(ip_type)
         try:
             conn_info = await cache.connect_info()
             ip_address = conn_info.get_preferred_ip(ip_type)
@@ -185,16 +227,16 @@ class AsyncConnector:
             # cache and re-raise the error
             await self._remove_cached(instance_uri)
             raise
-        logger.debug(f"['{instance_uri}']: Connecting to {ip_address}:5433")
+        logger.debug("['%s']: Connecting to %s:5433", instance_uri, ip_address)
 
-        # callable to be used for auto IAM authn
-        def get_authentication_token() -> str:
+        # callable to be used for auto IAM authn, asyncpg awaits its result
+        async def get_authentication_token() -> str:
             """Get OAuth2 access token to be used for IAM database authentication"""
-            # refresh credentials if expired
-            if not self._credentials.valid:
-                request = google.auth.transport.requests.Request()
-                self._credentials.refresh(request)
-            return self._credentials.token
+            # refresh credentials if expired, the refresh performs blocking
+            # I/O so it is run in a separate thread
+            if not credentials.token_state == TokenState.FRESH:
+                await asyncio.to_thread(credentials.refresh, self._auth_request)
+            return credentials.token
 
         # if enable_iam_auth is set, use auth token as database password
         if enable_iam_auth:
@@ -212,7 +254,7 @@ class AsyncConnector:
         """Stops all background refreshes and deletes the connection
         info cache from the map of caches.
         """
-        logger.debug(f"['{instance_uri}']: Removing connection info from cache")
+        logger.debug("['%s']: Removing connection info from cache", instance_uri)
         # remove cache from stored caches and close it
         cache = self._cache.pop(instance_uri)
         await cache.close()
@@ -233,6 +275,18 @@ class AsyncConnector:
     async def close(self) -> None:
         """Helper function to cancel RefreshAheadCaches' tasks
         and close client."""
-        await asyncio.gather(*[cache.close() for cache in self._cache.values()])
+        # close caches concurrently, making sure that a cache failing to close
+        # does not stop the other caches or the client from closing
+        results = await asyncio.gather(
+            *(cache.close() for cache in self._cache.values()),
+            return_exceptions=True,
+        )
         if self._client:
             await self._client.close()
+        # stop waiting on keys that are still being generated
+        if self._keys is not None and not self._keys.done():
+            self._keys.cancel()
+            await asyncio.wait([self._keys])
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
@@ -15,15 +15,16 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 
 import aiohttp
-from cryptography import x509
 from google.auth.credentials import TokenState
 from google.auth.transport import requests
 
 from google.cloud.alloydb.connector.connection_info import ConnectionInfo
+from google.cloud.alloydb.connector.refresh_utils import _get_expiration
 from google.cloud.alloydb.connector.version import __version__ as version
 
 if TYPE_CHECKING:
@@ -31,6 +32,10 @@ if TYPE_CHECKING:
 
 USER_AGENT: str = f"alloydb-python-connector/{version}"
 API_VERSION: str = "v1beta"
+# seconds an idle connection to the AlloyDB API is kept open for reuse
+KEEPALIVE_TIMEOUT: int = 60
+# seconds a resolved AlloyDB API address is cached for new connections
+DNS_CACHE_TTL: int = 300
 
 logger = logging.getLogger(name=__name__)
 
@@ -49,6 +54,29 @@ def _format_user_agent(
     return agent
 
 
+async def _read_response(resp: aiohttp.ClientResponse) -> dict[str, Any]:
+    """
+    Returns the decoded JSON body of an AlloyDB API response.
+
+    Raises an aiohttp.ClientResponseError for error statuses, using the
+    detailed AlloyDB API error message when the response contains one.
+    """
+    if resp.status >= 400:
+        # try to get response json for better error message
+        try:
+            resp_dict = json.loads(await resp.read())
+            message = resp_dict.get("error", {}).get("message")
+            if message:
+                resp.reason = message
+        # skip, raise_for_status will use the default reason
+        except Exception:
+            pass
+        resp.raise_for_status()
+    # decode the raw body directly, skipping aiohttp's content type check and
+    # intermediate str decode of the small API responses
+    return json.loads(await resp.read())
+
+
 class AlloyDBClient:
     def __init__(
         self,
@@ -86,14 +114,83 @@ class AlloyDBClient:
         if quota_project:
             headers["x-goog-user-project"] = quota_project
 
-        self._client = client if client else aiohttp.ClientSession(headers=headers)
+        if client is None:
+            # keep idle connections to the AlloyDB API open longer than the
+            # default 15s so refreshes of other instances can reuse them
+            # instead of performing a new TCP and TLS handshake, and cache
+            # DNS results longer than the default 10s so opening additional
+            # connections during a burst of refreshes skips the lookup
+            connector = aiohttp.TCPConnector(
+                keepalive_timeout=KEEPALIVE_TIMEOUT, ttl_dns_cache=DNS_CACHE_TTL
+            )
+            client = aiohttp.ClientSession(headers=headers, connector=connector)
+        self._client = client
         self._credentials = credentials
+        # transport reused for every credentials refresh
+        self._auth_request = requests.Request()
+        self._refresh_lock: Optional[asyncio.Lock] = None
         self._alloydb_api_endpoint = alloydb_api_endpoint
+        # static prefix of the AlloyDB API URLs, completed per request
+        self._api_base = f"{alloydb_api_endpoint}/{API_VERSION}"
+        # per-request headers shared by all API requests, rebuilt only when
+        # the token changes
+        self._token: Optional[str] = None
+        self._auth_headers: Optional[dict[str, str]] = None
         # asyncpg does not currently support using metadata exchange
         # only use metadata exchange for pg8000 driver
         self._use_metadata = True if driver == "pg8000" else False
+        # encoded generateClientCertificate body, keyed by public key
+        self._cert_body: Optional[tuple[str, bytes]] = None
         self._user_agent = user_agent
 
+    async def _refresh_credentials(self) -> None:
+        """Refreshes the credentials if they are not fresh.
+
+        The refresh performs blocking I/O, so it is run in a separate thread,
+        and concurrent refreshes of the connection info for several instances
+        share a single credentials refresh.
+        """
+        if self._credentials.token_state == TokenState.FRESH:
+            return
+        # created lazily so that it is bound to the running event loop
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            if not self._credentials.token_state == TokenState.FRESH:
+                await asyncio.to_thread(self._credentials.refresh, self._auth_request)
+
+    def _headers(self) -> dict[str, str]:
+        """Returns the Authorization and Content-Type headers for the
+        current token.
+
+        The content type is set per request as a caller-supplied session
+        does not carry the default session's JSON content type.
+        """
+        token = self._credentials.token
+        if self._auth_headers is None or token != self._token:
+            self._token = token
+            self._auth_headers = {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+            }
+        return self._auth_headers
+
+    def _client_cert_body(self, pub_key: str) -> bytes:
+        """
+        Returns the JSON-encoded generateClientCertificate request body.
+
+        The public key is shared by every refresh of a connector, so the
+        encoded body is cached and only rebuilt when the key changes.
+        """
+        if self._cert_body is None or self._cert_body[0] != pub_key:
+            data = {
+                "publicKey": pub_key,
+                "certDuration": "3600s",
+                "useMetadataExchange": self._use_metadata,
+            }
+            self._cert_body = (pub_key, json.dumps(data).encode())
+        return self._cert_body[1]
+
     async def _get_metadata(
         self,
         project: str,
@@ -118,26 +215,12 @@ class AlloyDBClient:
         Returns:
             dict: IP addresses of the AlloyDB instance.
         """
-        headers = {
-            "Authorization": f"Bearer {self._credentials.token}",
-        }
+        headers = self._headers()
 
-        url = f"{self._alloydb_api_endpoint}/{API_VERSION}/projects/{project}/locations/{region}/clusters/{cluster}/instances/{name}/connectionInfo"
+        url = f"{self._api_base}/projects/{project}/locations/{region}/clusters/{cluster}/instances/{name}/connectionInfo"
 
         resp = await self._client.get(url, headers=headers)
-        # try to get response json for better error message
-        try:
-            resp_dict = await resp.json()
-            if resp.status >= 400:
-                # if detailed error message is in json response, use as error message
-                message = resp_dict.get("error", {}).get("message")
-                if message:
-                    resp.reason = message
-        # skip, raise_for_status will catch all errors in finally block
-        except Exception:
-            pass
-        finally:
-            resp.raise_for_status()
+        resp_dict = await _read_response(resp)
 
         # Remove trailing period from PSC DNS name.
         psc_dns = resp_dict.get("pscDnsName")
@@ -175,32 +258,14 @@ class AlloyDBClient:
             tuple[str, list[str]]: tuple containing the CA certificate
                 and certificate chain for the AlloyDB instance.
         """
-        headers = {
-            "Authorization": f"Bearer {self._credentials.token}",
-        }
+        headers = self._headers()
 
-        url = f"{self._alloydb_api_endpoint}/{API_VERSION}/projects/{project}/locations/{region}/clusters/{cluster}:generateClientCertificate"
+        url = f"{self._api_base}/projects/{project}/locations/{region}/clusters/{cluster}:generateClientCertificate"
 
-        data = {
-            "publicKey": pub_key,
-            "certDuration": "3600s",
-            "useMetadataExchange": self._use_metadata,
-        }
-
-        resp = await self._client.post(url, headers=headers, json=data)
-        # try to get response json for better error message
-        try:
-            resp_dict = await resp.json()
-            if resp.status >= 400:
-                # if detailed error message is in json response, use as error message
-                message = resp_dict.get("error", {}).get("message")
-                if message:
-                    resp.reason = message
-        # skip, raise_for_status will catch all errors in finally block
-        except Exception:
-            pass
-        finally:
-            resp.raise_for_status()
+        resp = await self._client.post(
+            url, headers=headers, data=self._client_cert_body(pub_key)
+        )
+        resp_dict = await _read_response(resp)
 
         return (resp_dict["caCert"], resp_dict["pemCertificateChain"])
 
@@ -227,13 +292,12 @@ class AlloyDBClient:
             ConnectionInfo: All the information required to connect securely to
                 the AlloyDB instance.
         """
-        priv_key, pub_key = await keys
+        # before making AlloyDB API calls, refresh creds if required so that
+        # both requests below share a single token refresh
+        await self._refresh_credentials()
 
-        # before making AlloyDB API calls, refresh creds if required
-        if not self._credentials.token_state == TokenState.FRESH:
-            self._credentials.refresh(requests.Request())
-
-        # fetch metadata
+        # fetch metadata, which does not depend on the keys, while the
+        # key pair may still be generating
         metadata_task = asyncio.create_task(
             self._get_metadata(
                 project,
@@ -242,6 +306,11 @@ class AlloyDBClient:
                 name,
             )
         )
+        try:
+            priv_key, pub_key = await keys
+        except BaseException:
+            metadata_task.cancel()
+            raise
         # generate client and CA certs
         certs_task = asyncio.create_task(
             self._get_client_certificate(
@@ -257,8 +326,7 @@ class AlloyDBClient:
         # unpack certs
         ca_cert, cert_chain = certs
         # get expiration from client certificate
-        cert_obj = x509.load_pem_x509_certificate(cert_chain[0].encode("UTF-8"))
-        expiration = cert_obj.not_valid_after_utc
+        expiration = _get_expiration(cert_chain[0])
 
         return ConnectionInfo(
             cert_chain,
@@ -14,7 +14,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
+from dataclasses import field
 import logging
 import ssl
 from typing import Optional, TYPE_CHECKING
@@ -34,6 +36,13 @@ if TYPE_CHECKING:
 logger = logging.getLogger(name=__name__)
 
 
+def _load_certs(context: ssl.SSLContext, ca_cert: str, filename: str) -> None:
+    """Loads the file containing the private key and client certificate
+    chain, and the PEM-encoded CA certificate into the given SSL context."""
+    context.load_cert_chain(filename)
+    context.load_verify_locations(cadata=ca_cert)
+
+
 @dataclass
 class ConnectionInfo:
     """Contains all necessary information to connect securely to the
@@ -45,6 +54,15 @@ class ConnectionInfo:
     ip_addrs: dict[str, Optional[str]]
     expiration: datetime.datetime
     context: Optional[ssl.SSLContext] = None
+    # TLS session of the latest connection made with context, for resumption,
+    # handed to a single later connection
+    session: Optional[ssl.SSLSession] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # created lazily so that it is bound to the running event loop
+    _context_lock: Optional[asyncio.Lock] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     async def create_ssl_context(self) -> ssl.SSLContext:
         """Constructs a SSL/TLS context for the given connection info.
@@ -56,6 +74,17 @@ class ConnectionInfo:
         if self.context is not None:
             return self.context
 
+        # concurrent connections wait for a single context to be constructed
+        # rather than each parsing the same certificates and key
+        if self._context_lock is None:
+            self._context_lock = asyncio.Lock()
+        async with self._context_lock:
+            if self.context is None:
+                self.context = await self._build_ssl_context()
+        return self.context
+
+    async def _build_ssl_context(self) -> ssl.SSLContext:
+        """Builds a new SSL/TLS context from the connection info."""
         # create TLS context
         context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
         # TODO: Set check_hostname to True to verify the identity in the
@@ -64,17 +93,15 @@ class ConnectionInfo:
         # force TLSv1.3
         context.minimum_version = ssl.TLSVersion.TLSv1_3
 
-        # tmpdir and its contents are automatically deleted after the CA cert
-        # and cert chain are loaded into the SSLcontext. The values
-        # need to be written to files in order to be loaded by the SSLContext
+        # tmpdir and its contents are automatically deleted after the cert
+        # chain and key are loaded into the SSLcontext. The values need to
+        # be written to a file in order to be loaded by the SSLContext, while
+        # the CA cert is loaded from memory
         async with TemporaryDirectory() as tmpdir:
-            ca_filename, cert_chain_filename, key_filename = await _write_to_file(
-                tmpdir, self.ca_cert, self.cert_chain, self.key
-            )
-            context.load_cert_chain(cert_chain_filename, keyfile=key_filename)
-            context.load_verify_locations(cafile=ca_filename)
-        # set class attribute to cache context for subsequent calls
-        self.context = context
+            filename = await _write_to_file(tmpdir, self.cert_chain, self.key)
+            # parsing the certificates and private key is CPU-bound, so load
+            # them into the context off the event loop
+            await asyncio.to_thread(_load_certs, context, self.ca_cert, filename)
         return context
 
     def get_preferred_ip(self, ip_type: IPTypes) -> str:
@@ -15,13 +15,14 @@
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 import logging
 import socket
-import struct
 from threading import Thread
+from types import ModuleType
 from types import TracebackType
-from typing import Any, Optional, TYPE_CHECKING, Union
+from typing import Any, Callable, cast, Optional, TYPE_CHECKING, Union
 
 from google.auth import default
 from google.auth.credentials import TokenState
@@ -29,8 +30,10 @@ from google.auth.credentials import with_scopes_if_required
 from google.auth.transport import requests
 
 from google.cloud.alloydb.connector.client import AlloyDBClient
+from google.cloud.alloydb.connector.enums import _to_ip_type
 from google.cloud.alloydb.connector.enums import IPTypes
 from google.cloud.alloydb.connector.enums import RefreshStrategy
+from google.cloud.alloydb.connector.exceptions import ConnectorLoopError
 from google.cloud.alloydb.connector.instance import RefreshAheadCache
 from google.cloud.alloydb.connector.lazy import LazyRefreshCache
 import google.cloud.alloydb.connector.pg8000 as pg8000
@@ -42,17 +45,61 @@ if TYPE_CHECKING:
 
     from google.auth.credentials import Credentials
 
+    from google.cloud.alloydb.connector.connection_info import ConnectionInfo
+
 logger = logging.getLogger(name=__name__)
 
+# connection arguments derived from the instance, never taken from the user
+_RESERVED_KWARGS = ("host", "ssl", "port")
+# supported database drivers, mapped to the module providing their connect
+_DRIVERS: dict[str, ModuleType] = {"pg8000": pg8000}
+
 # the port the AlloyDB server-side proxy receives connections on
 SERVER_PROXY_PORT = 5433
 # the maximum amount of time to wait before aborting a metadata exchange
 IO_TIMEOUT = 30
+# size of the big-endian uint32 prefixing metadata exchange messages
+LENGTH_PREFIX_SIZE = 4
+
+# the pure-Python protobuf implementation is considerably slower at
+# serializing and parsing metadata exchange messages, api_implementation is a
+# private protobuf module so its absence is ignored
+try:
+    from google.protobuf.internal import api_implementation
+except ImportError:
+    pass
+else:
+    if api_implementation.Type() == "python":
+        logger.debug(
+            "Using the pure-Python protobuf implementation, install a "
+            "protobuf release with C extensions for faster metadata exchange"
+        )
+
+
+def _recv_exactly(sock: ssl.SSLSocket, size: int, error: str) -> bytearray:
+    """
+    Reads exactly size bytes from the socket into a single preallocated
+    buffer, raising a RuntimeError with the given message if the connection
+    is closed first.
+    """
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        n = sock.recv_into(view[received:])
+        if not n:
+            raise RuntimeError(error)
+        received += n
+    return buffer
 
 
 class Connector:
     """A class to configure and create connections to Cloud SQL instances.
 
+    The Connector runs its refresh operations on an event loop in a background
+    thread so that it can be used from synchronous code. Applications running
+    on an event loop should use AsyncConnector instead.
+
     Args:
         credentials (google.auth.credentials.Credentials):
             A credentials object created from the google-auth Python library.
@@ -87,32 +134,87 @@ class Connector:
         self._loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
         self._thread = Thread(target=self._loop.run_forever, daemon=True)
         self._thread.start()
+        # dedicated threads for the blocking metadata exchange and driver
+        # connect, kept separate from the loop's default executor
+        self._executor = ThreadPoolExecutor(thread_name_prefix="alloydb-connect")
         self._cache: dict[str, Union[RefreshAheadCache, LazyRefreshCache]] = {}
         # initialize default params
         self._quota_project = quota_project
         self._alloydb_api_endpoint = alloydb_api_endpoint
         self._enable_iam_auth = enable_iam_auth
         # if ip_type is str, convert to IPTypes enum
-        if isinstance(ip_type, str):
-            ip_type = IPTypes(ip_type.upper())
-        self._ip_type = ip_type
+        self._ip_type = _to_ip_type(ip_type)
         # if refresh_strategy is str, convert to RefreshStrategy enum
         if isinstance(refresh_strategy, str):
             refresh_strategy = RefreshStrategy(refresh_strategy.upper())
         self._refresh_strategy = refresh_strategy
         self._user_agent = user_agent
         # initialize credentials
-        scopes = ["https://www.googleapis.com/auth/cloud-platform"]
+        self._scopes = ["https://www.googleapis.com/auth/cloud-platform"]
+        self._credentials: Optional[Credentials] = None
+        self._credentials_task: Optional[asyncio.Task] = None
         if credentials:
-            self._credentials = with_scopes_if_required(credentials, scopes=scopes)
-        # otherwise use application default credentials
-        else:
-            self._credentials, _ = default(scopes=scopes)
-        self._keys = asyncio.wrap_future(
-            asyncio.run_coroutine_threadsafe(generate_keys(), self._loop),
-            loop=self._loop,
-        )
+            self._credentials = with_scopes_if_required(
+                credentials, scopes=self._scopes
+            )
+        # otherwise application default credentials are looked up on first
+        # connect, as the lookup may perform blocking I/O
+        # transport reused for every credentials refresh
+        self._auth_request = requests.Request()
+        # keys are generated on first connect, see connect_async
+        self._keys: Optional[asyncio.Future] = None
         self._client: Optional[AlloyDBClient] = None
+        # serialized metadata exchange requests, keyed by whether IAM
+        # authentication is enabled, along with the token they contain
+        self._metadata_requests: dict[bool, tuple[str, bytes]] = {}
+        # with credentials known up front, initialize the client on the
+        # background loop now rather than on the first connect, the Connector
+        # supports a single driver so the client's driver is known as well
+        if self._credentials is not None:
+            (driver,) = _DRIVERS
+            asyncio.run_coroutine_threadsafe(
+                self._init_client(self._credentials, driver), self._loop
+            ).result()
+
+    async def _init_client(
+        self, credentials: Credentials, driver: str
+    ) -> AlloyDBClient:
+        """Initializes the AlloyDB API client.
+
+        The client has to be initialized in async context as it owns an
+        aiohttp session bound to the background event loop.
+        """
+        self._client = AlloyDBClient(
+            self._alloydb_api_endpoint,
+            self._quota_project,
+            credentials,
+            user_agent=self._user_agent,
+            driver=driver,
+        )
+        return self._client
+
+    async def _resolve_credentials(self) -> Credentials:
+        """Returns the credentials used by the connector.
+
+        Application default credentials are looked up in a separate thread
+        the first time they are needed so the lookup does not block the
+        event loop.
+        """
+        if self._credentials is None:
+            # concurrent first connects share a single lookup
+            if self._credentials_task is None:
+                self._credentials_task = asyncio.create_task(
+                    asyncio.to_thread(default, scopes=self._scopes)
+                )
+            task = self._credentials_task
+            try:
+                self._credentials, _ = await asyncio.shield(task)
+            except Exception:
+                # allow a later connect to retry a failed lookup
+                if self._credentials_task is task:
+                    self._credentials_task = None
+                raise
+        return self._credentials
 
     def connect(self, instance_uri: str, driver: str, **kwargs: Any) -> Any:
         """
@@ -147,6 +249,10 @@ class Connector:
         AlloyDB instance IP address. Creates a secure TLS connection
         to establish connection to AlloyDB instance.
 
+        Must be called from the Connector's background event loop, which its
+        API client, keys and caches are bound to. Use connect() from any
+        other thread or event loop.
+
         Args:
             instance_uri (str): The instance URI of the AlloyDB instance.
                 ex. projects/<PROJECT>/locations/<REGION>/clusters/<CLUSTER>/instances/<INSTANCE>
@@ -157,55 +263,61 @@ class Connector:
 
         Returns:
             connection: A DBAPI connection to the specified AlloyDB instance.
+
+        Raises:
+            ConnectorLoopError: If called from an event loop other than the
+                Connector's background event loop.
         """
-        if self._client is None:
-            # lazy init client as it has to be initialized in async context
-            self._client = AlloyDBClient(
-                self._alloydb_api_endpoint,
-                self._quota_project,
-                self._credentials,
-                user_agent=self._user_agent,
-                driver=driver,
+        if asyncio.get_running_loop() is not self._loop:
+            raise ConnectorLoopError(
+                "Running event loop does not match the Connector's event loop. "
+                "Connector.connect_async() must be called from the Connector's "
+                "background event loop, use Connector.connect() instead."
             )
+        # only accept supported database drivers, before credentials are
+        # resolved, keys are generated or the client is bound to the driver
+        driver_module = _DRIVERS.get(driver)
+        if driver_module is None:
+            raise ValueError(f"Driver '{driver}' is not a supported database driver.")
+        connector = driver_module.connect
+
+        credentials = await self._resolve_credentials()
+        client = self._client
+        if client is None:
+            # application default credentials are only resolved on first
+            # connect, so the client is initialized now
+            client = await self._init_client(credentials, driver)
+        # start generating the keys on first use, as a task on the background
+        # loop that the caches await rather than a future handed across threads
+        if self._keys is None:
+            self._keys = asyncio.create_task(generate_keys())
         enable_iam_auth = kwargs.pop("enable_iam_auth", self._enable_iam_auth)
         # use existing connection info if possible
-        if instance_uri in self._cache:
-            cache = self._cache[instance_uri]
-        else:
+        cache = self._cache.get(instance_uri)
+        if cache is None:
             if self._refresh_strategy == RefreshStrategy.LAZY:
                 logger.debug(
-                    f"['{instance_uri}']: Refresh strategy is set to lazy refresh"
+                    "['%s']: Refresh strategy is set to lazy refresh", instance_uri
                 )
-                cache = LazyRefreshCache(instance_uri, self._client, self._keys)
+                cache = LazyRefreshCache(instance_uri, client, self._keys)
             else:
                 logger.debug(
-                    f"['{instance_uri}']: Refresh strategy is set to background"
-                    " refresh"
+                    "['%s']: Refresh strategy is set to background refresh",
+                    instance_uri,
                 )
-                cache = RefreshAheadCache(instance_uri, self._client, self._keys)
+                cache = RefreshAheadCache(instance_uri, client, self._keys)
             self._cache[instance_uri] = cache
-            logger.debug(f"['{instance_uri}']: Connection info added to cache")
-
-        connect_func = {
-            "pg8000": pg8000.connect,
-        }
-        # only accept supported database drivers
-        try:
-            connector = connect_func[driver]
-        except KeyError:
-            raise ValueError(f"Driver '{driver}' is not a supported database driver.")
+            logger.debug("['%s']: Connection info added to cache", instance_uri)
 
         # Host and ssl options come from the certificates and instance IP address
         # so we don't want the user to specify them.
-        kwargs.pop("host", None)
-        kwargs.pop("ssl", None)
-        kwargs.pop("port", None)
+        for kwarg in _RESERVED_KWARGS:
+            kwargs.pop(kwarg, None)
 
         # get connection info for AlloyDB instance
         ip_type: IPTypes | str = kwargs.pop("ip_type", self._ip_type)
         # if ip_type is str, convert to IPTypes enum
-        if isinstance(ip_type, str):
-            ip_type = IPTypes(ip_type.upper())
+        ip_type = _to_ip_type(ip_type)
         try:
             conn_info = await cache.connect_info()
             ip_address = conn_info.get_preferred_ip(ip_type)
@@ -214,27 +326,89 @@ class Connector:
             # cache and re-raise the error
             await self._remove_cached(instance_uri)
             raise
-        logger.debug(f"['{instance_uri}']: Connecting to {ip_address}:5433")
+        logger.debug("['%s']: Connecting to %s:5433", instance_uri, ip_address)
 
-        # synchronous drivers are blocking and run using executor
+        # synchronous drivers are blocking and run using executor, together
+        # with the metadata exchange in a single executor call
         try:
-            metadata_partial = partial(
-                self.metadata_exchange,
+            ctx = await conn_info.create_ssl_context()
+            # TLS session resumption is best-effort: each stored session is
+            # handed to a single connection, as TLS 1.3 tickets should not be
+            # reused, and concurrent connections perform a full handshake
+            session, conn_info.session = conn_info.session, None
+            connect_partial = partial(
+                self._connect_sync,
+                connector,
+                conn_info,
                 ip_address,
-                await conn_info.create_ssl_context(),
+                ctx,
+                session,
                 enable_iam_auth,
                 driver,
+                **kwargs,
             )
-            sock = await self._loop.run_in_executor(None, metadata_partial)
-            connect_partial = partial(connector, sock, **kwargs)
-            return await self._loop.run_in_executor(None, connect_partial)
+            return await self._loop.run_in_executor(self._executor, connect_partial)
         except Exception:
             # we attempt a force refresh, then throw the error
             await cache.force_refresh()
             raise
 
+    def _connect_sync(
+        self,
+        connector: Callable[..., Any],
+        conn_info: ConnectionInfo,
+        ip_address: str,
+        ctx: ssl.SSLContext,
+        session: Optional[ssl.SSLSession],
+        enable_iam_auth: bool,
+        driver: str,
+        **kwargs: Any,
+    ) -> Any:
+        """Performs the metadata exchange and connects the database driver.
+
+        Both steps are blocking and are run together in the executor.
+        """
+        sock = self.metadata_exchange(ip_address, ctx, enable_iam_auth, driver, session)
+        # store the new session so the next connection resumes it
+        conn_info.session = sock.session
+        return connector(sock, **kwargs)
+
+    def _metadata_exchange_request(self, enable_iam_auth: bool, token: str) -> bytes:
+        """
+        Returns the length-prefixed, serialized MetadataExchangeRequest.
+
+        The request only changes with the auth type and the OAuth2 token, so
+        it is serialized once per token and auth type and then reused.
+        """
+        cached = self._metadata_requests.get(enable_iam_auth)
+        if cached is not None and cached[0] == token:
+            return cached[1]
+        # set auth type for metadata exchange
+        auth_type = connectorspb.MetadataExchangeRequest.DB_NATIVE
+        if enable_iam_auth:
+            auth_type = connectorspb.MetadataExchangeRequest.AUTO_IAM
+
+        # form metadata exchange request
+        req = connectorspb.MetadataExchangeRequest(
+            user_agent=f"{self._client._user_agent}",  # type: ignore
+            auth_type=auth_type,
+            oauth2_token=token,
+        )
+
+        # pack big-endian unsigned integer (4 bytes)
+        packed_len = req.ByteSize().to_bytes(LENGTH_PREFIX_SIZE, "big")
+
+        message = packed_len + req.SerializeToString()
+        self._metadata_requests[enable_iam_auth] = (token, message)
+        return message
+
     def metadata_exchange(
-        self, ip_address: str, ctx: ssl.SSLContext, enable_iam_auth: bool, driver: str
+        self,
+        ip_address: str,
+        ctx: ssl.SSLContext,
+        enable_iam_auth: bool,
+        driver: str,
+        session: Optional[ssl.SSLSession] = None,
     ) -> ssl.SSLSocket:
         """
         Sends metadata about the connection prior to the database
@@ -264,70 +438,59 @@ class Connector:
             enable_iam_auth (bool): Flag to enable IAM database authentication.
             driver (str): A string representing the database driver to connect with.
                 Supported drivers are pg8000.
+            session (ssl.SSLSession): TLS session of a previous connection made
+                with ctx to resume, skipping a full handshake.
+                Optional, defaults to None and performs a full handshake.
 
         Returns:
             sock (ssl.SSLSocket): mTLS/SSL socket connected to AlloyDB Proxy server.
         """
         # Create socket and wrap with SSL/TLS context
+        raw_sock = socket.create_connection((ip_address, SERVER_PROXY_PORT))
+        # send the small metadata exchange and database protocol messages
+        # without Nagle's algorithm delay, and detect dead connections
+        raw_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        raw_sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
         sock = ctx.wrap_socket(
-            socket.create_connection((ip_address, SERVER_PROXY_PORT)),
+            raw_sock,
             server_hostname=ip_address,
+            session=session,
         )
-        # set auth type for metadata exchange
-        auth_type = connectorspb.MetadataExchangeRequest.DB_NATIVE
-        if enable_iam_auth:
-            auth_type = connectorspb.MetadataExchangeRequest.AUTO_IAM
-
+        # credentials are resolved by connect_async prior to metadata exchange
+        credentials = cast("Credentials", self._credentials)
         # Ensure the credentials are in fact valid before proceeding.
-        if not self._credentials.token_state == TokenState.FRESH:
-            self._credentials.refresh(requests.Request())
-
-        # form metadata exchange request
-        req = connectorspb.MetadataExchangeRequest(
-            user_agent=f"{self._client._user_agent}",  # type: ignore
-            auth_type=auth_type,
-            oauth2_token=self._credentials.token,
-        )
+        if not credentials.token_state == TokenState.FRESH:
+            credentials.refresh(self._auth_request)
 
         # set I/O timeout
         sock.settimeout(IO_TIMEOUT)
 
-        # pack big-endian unsigned integer (4 bytes)
-        packed_len = struct.pack(">I", req.ByteSize())
-
         # send metadata message length and request message
-        sock.sendall(packed_len + req.SerializeToString())
+        sock.sendall(
+            self._metadata_exchange_request(enable_iam_auth, credentials.token)
+        )
 
         # form metadata exchange response
         resp = connectorspb.MetadataExchangeResponse()
 
         # read metadata message length (4 bytes)
-        message_len_buffer_size = struct.Struct(">I").size
-        message_len_buffer = b""
-        while message_len_buffer_size > 0:
-            chunk = sock.recv(message_len_buffer_size)
-            if not chunk:
-                raise RuntimeError(
-                    "Connection closed while getting metadata exchange length!"
-                )
-            message_len_buffer += chunk
-            message_len_buffer_size -= len(chunk)
+        message_len_buffer = _recv_exactly(
+            sock,
+            LENGTH_PREFIX_SIZE,
+            "Connection closed while getting metadata exchange length!",
+        )
 
-        (message_len,) = struct.unpack(">I", message_len_buffer)
+        message_len = int.from_bytes(message_len_buffer, "big")
 
         # read metadata exchange message
-        buffer = b""
-        while message_len > 0:
-            chunk = sock.recv(message_len)
-            if not chunk:
-                raise RuntimeError(
-                    "Connection closed while performing metadata exchange!"
-                )
-            buffer += chunk
-            message_len -= len(chunk)
+        buffer = _recv_exactly(
+            sock,
+            message_len,
+            "Connection closed while performing metadata exchange!",
+        )
 
         # parse metadata exchange response from buffer
-        resp.ParseFromString(buffer)
+        resp.ParseFromString(bytes(buffer))
 
         # reset socket back to blocking mode
         sock.setblocking(True)
@@ -344,7 +507,7 @@ class Connector:
         """Stops all background refreshes and deletes the connection
         info cache from the map of caches.
         """
-        logger.debug(f"['{instance_uri}']: Removing connection info from cache")
+        logger.debug("['%s']: Removing connection info from cache", instance_uri)
         # remove cache from stored caches and close it
         cache = self._cache.pop(instance_uri)
         await cache.close()
@@ -377,10 +540,24 @@ class Connector:
                 self._loop.call_soon_threadsafe(self._loop.stop)
             # wait for thread to finish closing (i.e. loop to stop)
             self._thread.join()
+        # release connection threads without waiting on in-flight connects
+        self._executor.shutdown(wait=False)
 
     async def close_async(self) -> None:
         """Helper function to cancel RefreshAheadCaches' tasks
         and close client."""
-        await asyncio.gather(*[cache.close() for cache in self._cache.values()])
+        # close caches concurrently, making sure that a cache failing to close
+        # does not stop the other caches or the client from closing
+        results = await asyncio.gather(
+            *(cache.close() for cache in self._cache.values()),
+            return_exceptions=True,
+        )
         if self._client:
             await self._client.close()
+        # stop waiting on keys that are still being generated
+        if self._keys is not None and not self._keys.done():
+            self._keys.cancel()
+            await asyncio.wait([self._keys])
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
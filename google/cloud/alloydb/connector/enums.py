@@ -34,6 +34,25 @@ class IPTypes(Enum):
         )
 
 
+# ip_type arguments accepted by the connectors, mapped to their IPTypes member
+_IP_TYPES: dict[str | IPTypes, IPTypes] = {
+    **{ip_type: ip_type for ip_type in IPTypes},
+    **{ip_type.value: ip_type for ip_type in IPTypes},
+    **{ip_type.value.lower(): ip_type for ip_type in IPTypes},
+}
+
+
+def _to_ip_type(ip_type: str | IPTypes) -> IPTypes:
+    """
+    Converts a case-insensitive string or IPTypes member to an IPTypes member.
+    """
+    member = _IP_TYPES.get(ip_type)
+    if member is None:
+        # raises ValueError for unsupported strings
+        member = IPTypes(str(ip_type).upper())
+    return member
+
+
 class RefreshStrategy(Enum):
     """
     Enum for specifying refresh strategy to connect to AlloyDB with.
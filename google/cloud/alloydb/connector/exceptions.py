@@ -19,3 +19,7 @@ class RefreshError(Exception):
 
 class IPTypeNotFoundError(Exception):
     pass
+
+
+class ConnectorLoopError(Exception):
+    pass
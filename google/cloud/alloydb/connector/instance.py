@@ -18,9 +18,10 @@ import asyncio
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
+from functools import lru_cache
 import logging
 import re
-from typing import TYPE_CHECKING
+from typing import cast, TYPE_CHECKING
 
 from google.cloud.alloydb.connector.connection_info import ConnectionInfo
 from google.cloud.alloydb.connector.exceptions import RefreshError
@@ -36,24 +37,28 @@ if TYPE_CHECKING:
 logger = logging.getLogger(name=__name__)
 
 INSTANCE_URI_REGEX = re.compile(
-    "projects/([^:]+(:[^:]+)?)/locations/([^:]+)/clusters/([^:]+)/instances/([^:]+)"
+    "projects/(?P<project>[^:]+(?::[^:]+)?)/locations/(?P<region>[^:]+)"
+    "/clusters/(?P<cluster>[^:]+)/instances/(?P<name>[^:]+)"
 )
 
 
+# parsed results are cached as caches for an instance URI are recreated
+# whenever they are invalidated by a failed connection attempt
+@lru_cache(maxsize=128)
 def _parse_instance_uri(instance_uri: str) -> tuple[str, str, str, str]:
     # should take form "projects/<PROJECT>/locations/<REGION>/clusters/<CLUSTER>/instances/<INSTANCE>"
-    if INSTANCE_URI_REGEX.fullmatch(instance_uri) is None:
+    match = INSTANCE_URI_REGEX.fullmatch(instance_uri)
+    if match is None:
         raise ValueError(
             "Arg `instance_uri` must have "
             "format: projects/<PROJECT>/locations/<REGION>/clusters/<CLUSTER>/instances/<INSTANCE>, projects/<DOMAIN>:<PROJECT>/locations/<REGION>/clusters/<CLUSTER>/instances/<INSTANCE>"
             f"got {instance_uri}."
         )
-    instance_uri_split = INSTANCE_URI_REGEX.split(instance_uri)
     return (
-        instance_uri_split[1],
-        instance_uri_split[3],
-        instance_uri_split[4],
-        instance_uri_split[5],
+        match.group("project"),
+        match.group("region"),
+        match.group("cluster"),
+        match.group("name"),
     )
 
 
@@ -72,6 +77,20 @@ class RefreshAheadCache:
         keys (tuple[rsa.RSAPrivateKey, str]): Private and Public key pair.
     """
 
+    __slots__ = (
+        "_project",
+        "_region",
+        "_cluster",
+        "_name",
+        "_instance_uri",
+        "_client",
+        "_keys",
+        "_refresh_rate_limiter",
+        "_refresh_in_progress",
+        "_current",
+        "_next",
+    )
+
     def __init__(
         self,
         instance_uri: str,
@@ -90,7 +109,7 @@ class RefreshAheadCache:
             max_capacity=2,
             rate=1 / 30,
         )
-        self._refresh_in_progress = asyncio.locks.Event()
+        self._refresh_in_progress = False
         # For the initial refresh operation, set current = next so that
         # connection requests block until the first refresh is complete.
         self._current: asyncio.Task = self._schedule_refresh(0)
@@ -106,9 +125,9 @@ class RefreshAheadCache:
         Returns:
             ConnectionInfo: Result of the refresh operation.
         """
-        self._refresh_in_progress.set()
+        self._refresh_in_progress = True
         logger.debug(
-            f"['{self._instance_uri}']: Connection info refresh operation started"
+            "['%s']: Connection info refresh operation started", self._instance_uri
         )
 
         try:
@@ -121,23 +140,25 @@ class RefreshAheadCache:
                 self._keys,
             )
             logger.debug(
-                f"['{self._instance_uri}']: Connection info refresh operation"
-                " complete"
+                "['%s']: Connection info refresh operation complete",
+                self._instance_uri,
             )
             logger.debug(
-                f"['{self._instance_uri}']: Current certificate expiration = "
-                f"{connection_info.expiration.isoformat()}"
+                "['%s']: Current certificate expiration = %s",
+                self._instance_uri,
+                connection_info.expiration.isoformat(),
             )
 
         except Exception as e:
             logger.debug(
-                f"['{self._instance_uri}']: Connection info refresh operation"
-                f" failed: {str(e)}"
+                "['%s']: Connection info refresh operation failed: %s",
+                self._instance_uri,
+                e,
             )
             raise
 
         finally:
-            self._refresh_in_progress.clear()
+            self._refresh_in_progress = False
         return connection_info
 
     def _schedule_refresh(self, delay: int) -> asyncio.Task:
@@ -151,6 +172,11 @@ class RefreshAheadCache:
             asyncio.Task[ConnectionInfo]: A task representing the scheduled
                 refresh operation.
         """
+        # an immediate refresh is in progress as soon as it is scheduled, so
+        # that force refreshes requested before it starts share it rather
+        # than cancelling and rescheduling it
+        if delay <= 0:
+            self._refresh_in_progress = True
         return asyncio.create_task(self._refresh_operation(delay))
 
     async def _refresh_operation(self, delay: int) -> ConnectionInfo:
@@ -164,32 +190,34 @@ class RefreshAheadCache:
         Returns:
             ConnectionInfo: Refresh result for an AlloyDB instance.
         """
-        refresh_task: asyncio.Task
+        # the task running this operation holds the refresh result or error,
+        # so the refresh is awaited directly rather than in a separate task
+        refresh_task = cast(asyncio.Task, asyncio.current_task())
         try:
             if delay > 0:
                 await asyncio.sleep(delay)
-            refresh_task = asyncio.create_task(self._perform_refresh())
-            refresh_result = await refresh_task
+            refresh_result = await self._perform_refresh()
             # check that refresh is valid
-            if not await _is_valid(refresh_task):
+            if datetime.now(timezone.utc) >= refresh_result.expiration:
                 raise RefreshError(
                     f"['{self._instance_uri}']: Invalid refresh operation. Certficate appears to be expired."
                 )
         except asyncio.CancelledError:
             logger.debug(
-                f"['{self._instance_uri}']: Scheduled refresh operation cancelled"
+                "['%s']: Scheduled refresh operation cancelled", self._instance_uri
             )
             raise
         # bad refresh attempt
         except Exception:
             logger.info(
-                f"['{self._instance_uri}']: "
-                "An error occurred while performing refresh. "
-                "Scheduling another refresh attempt immediately"
+                "['%s']: An error occurred while performing refresh. "
+                "Scheduling another refresh attempt immediately",
+                self._instance_uri,
             )
             # check if current refresh result is invalid (expired),
-            # don't want to replace valid result with invalid refresh
-            if not await _is_valid(self._current):
+            # don't want to replace valid result with invalid refresh, a
+            # current refresh that is still pending is this failed operation
+            if not self._current.done() or not await _is_valid(self._current):
                 self._current = refresh_task
             # schedule new refresh attempt immediately
             self._next = self._schedule_refresh(0)
@@ -198,12 +226,17 @@ class RefreshAheadCache:
         self._current = refresh_task
         # calculate refresh delay based on certificate expiration
         delay = _seconds_until_refresh(refresh_result.expiration)
-        logger.debug(
-            f"['{self._instance_uri}']: Connection info refresh operation"
-            " scheduled for "
-            f"{(datetime.now(timezone.utc) + timedelta(seconds=delay)).isoformat(timespec='seconds')} "
-            f"(now + {timedelta(seconds=delay)})"
-        )
+        # the scheduled time is only computed when it is logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "['%s']: Connection info refresh operation scheduled for %s "
+                "(now + %s)",
+                self._instance_uri,
+                (datetime.now(timezone.utc) + timedelta(seconds=delay)).isoformat(
+                    timespec="seconds"
+                ),
+                timedelta(seconds=delay),
+            )
         self._next = self._schedule_refresh(delay)
 
         return refresh_result
@@ -214,7 +247,7 @@ class RefreshAheadCache:
         for future connection attempts.
         """
         # if next refresh is not already in progress, cancel it and schedule new one immediately
-        if not self._refresh_in_progress.is_set():
+        if not self._refresh_in_progress:
             self._next.cancel()
             self._next = self._schedule_refresh(0)
         # block all sequential connection attempts on the next refresh result if current is invalid
@@ -225,15 +258,22 @@ class RefreshAheadCache:
         """Retrieves ConnectionInfo instance for establishing a secure
         connection to the AlloyDB instance.
         """
-        return await self._current
+        current = self._current
+        # return a completed refresh's result directly, without scheduling
+        # another wakeup on the event loop
+        if current.done() and not current.cancelled() and not current.exception():
+            return current.result()
+        # the refresh is shared with other callers, so a caller cancelling
+        # its connection attempt must not cancel the refresh itself
+        return await asyncio.shield(current)
 
     async def close(self) -> None:
         """
         Cancel refresh tasks.
         """
         logger.debug(
-            f"['{self._instance_uri}']: Canceling connection info refresh"
-            " operation tasks"
+            "['%s']: Canceling connection info refresh operation tasks",
+            self._instance_uri,
         )
         self._current.cancel()
         self._next.cancel()
@@ -13,10 +13,8 @@
 # limitations under the License.
 
 import asyncio
-from datetime import datetime
-from datetime import timedelta
-from datetime import timezone
 import logging
+from time import time
 from typing import Optional
 
 from google.cloud.alloydb.connector.client import AlloyDBClient
@@ -36,6 +34,20 @@ class LazyRefreshCache:
     This is the recommended option for serverless environments.
     """
 
+    __slots__ = (
+        "_project",
+        "_region",
+        "_cluster",
+        "_name",
+        "_instance_uri",
+        "_keys",
+        "_client",
+        "_lock",
+        "_cached",
+        "_refresh_at",
+        "_needs_refresh",
+    )
+
     def __init__(
         self,
         instance_uri: str,
@@ -61,6 +73,10 @@ class LazyRefreshCache:
         self._client = client
         self._lock = asyncio.Lock()
         self._cached: Optional[ConnectionInfo] = None
+        # POSIX timestamp from which the cached info needs to be refreshed,
+        # kept as a float so the check on each connection does no datetime
+        # arithmetic
+        self._refresh_at = 0.0
         self._needs_refresh = False
 
     async def force_refresh(self) -> None:
@@ -71,28 +87,40 @@ class LazyRefreshCache:
         async with self._lock:
             self._needs_refresh = True
 
+    def _valid_cached(self) -> Optional[ConnectionInfo]:
+        """Returns the cached ConnectionInfo if it can still be used."""
+        # If connection info is cached, check expiration.
+        # Pad expiration with a buffer to give the client plenty of time to
+        # establish a connection to the server with the certificate.
+        if self._cached and not self._needs_refresh and time() < self._refresh_at:
+            return self._cached
+        return None
+
     async def connect_info(self) -> ConnectionInfo:
         """Retrieves ConnectionInfo instance for establishing a secure
         connection to the AlloyDB instance.
         """
+        # serve valid cached info without waiting on the lock, which is only
+        # needed to share a single refresh between concurrent callers
+        cached = self._valid_cached()
+        if cached is not None:
+            logger.debug(
+                "['%s']: Connection info is still valid, using cached info",
+                self._instance_uri,
+            )
+            return cached
         async with self._lock:
-            # If connection info is cached, check expiration.
-            # Pad expiration with a buffer to give the client plenty of time to
-            # establish a connection to the server with the certificate.
-            if (
-                self._cached
-                and not self._needs_refresh
-                and datetime.now(timezone.utc)
-                < (self._cached.expiration - timedelta(seconds=_refresh_buffer))
-            ):
+            # another caller may have refreshed while waiting on the lock
+            cached = self._valid_cached()
+            if cached is not None:
                 logger.debug(
-                    f"['{self._instance_uri}']: Connection info "
-                    "is still valid, using cached info"
+                    "['%s']: Connection info is still valid, using cached info",
+                    self._instance_uri,
                 )
-                return self._cached
+                return cached
             logger.debug(
-                f"['{self._instance_uri}']: Connection info "
-                "refresh operation started"
+                "['%s']: Connection info refresh operation started",
+                self._instance_uri,
             )
             try:
                 conn_info = await self._client.get_connection_info(
@@ -104,19 +132,22 @@ class LazyRefreshCache:
                 )
             except Exception as e:
                 logger.debug(
-                    f"['{self._instance_uri}']: Connection info "
-                    f"refresh operation failed: {str(e)}"
+                    "['%s']: Connection info refresh operation failed: %s",
+                    self._instance_uri,
+                    e,
                 )
                 raise
             logger.debug(
-                f"['{self._instance_uri}']: Connection info "
-                "refresh operation completed successfully"
+                "['%s']: Connection info refresh operation completed successfully",
+                self._instance_uri,
             )
             logger.debug(
-                f"['{self._instance_uri}']: Current certificate "
-                f"expiration = {str(conn_info.expiration)}"
+                "['%s']: Current certificate expiration = %s",
+                self._instance_uri,
+                conn_info.expiration,
             )
             self._cached = conn_info
+            self._refresh_at = conn_info.expiration.timestamp() - _refresh_buffer
             self._needs_refresh = False
             return conn_info
 
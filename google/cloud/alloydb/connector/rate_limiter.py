@@ -20,7 +20,10 @@ class AsyncRateLimiter(object):
     An asyncio-compatible rate limiter.
 
     Uses the Token Bucket algorithm (https://en.wikipedia.org/wiki/Token_bucket)
-    to limit the number of function calls over a time interval using an event queue.
+    to limit the number of function calls over a time interval. The bucket is
+    tracked as the time at which it will next be full, so each caller is
+    assigned the time its token becomes available without holding a lock
+    while it waits.
 
     Args:
         max_capacity (int): The maximum capacity of tokens the bucket
@@ -37,41 +40,31 @@ class AsyncRateLimiter(object):
     ) -> None:
         self._rate = rate
         self._max_capacity = max_capacity
-        self._loop = asyncio.get_running_loop()
-        self._tokens: float = max_capacity
-        self._last_token_update = self._loop.time()
-        self._lock = asyncio.Lock()
-
-    def _update_token_count(self) -> None:
-        """
-        Calculates how much time has passed since the last leak and removes the
-        appropriate amount of events from the queue.
-        Leaking is done lazily, meaning that if there is a large time gap between
-        leaks, the next set of calls might be a burst if burst_size > 1
-        """
-        now = self._loop.time()
-        time_elapsed = now - self._last_token_update
-        new_tokens = time_elapsed * self._rate
-        self._tokens = min(new_tokens + self._tokens, self._max_capacity)
-        self._last_token_update = now
-
-    async def _wait_for_next_token(self) -> None:
-        """
-        Wait until enough time has elapsed to add another token.
-        """
-        token_deficit = 1 - self._tokens
-        if token_deficit > 0:
-            wait_time = token_deficit / self._rate
-            await asyncio.sleep(wait_time)
+        # seconds between tokens, precomputed for acquire
+        self._interval = 1 / rate
+        # time at which the bucket is full again, starts out full
+        self._full_at = float("-inf")
 
     async def acquire(self) -> None:
         """
         Waits for a token to become available, if necessary, then subtracts token and allows
         request to go through.
         """
-        async with self._lock:
-            self._update_token_count()
-            if self._tokens < 1:
-                await self._wait_for_next_token()
-                self._update_token_count()
-            self._tokens -= 1
+        # use the clock of the loop the caller is running on
+        now = asyncio.get_running_loop().time()
+        # a bucket that filled up in the past does not store extra tokens
+        full_at = max(self._full_at, now)
+        # the token is available once the bucket holds at least one token,
+        # i.e. max_capacity - 1 token intervals before it is full
+        available_at = full_at - (self._max_capacity - 1) * self._interval
+        # reserve the token before waiting so concurrent callers are assigned
+        # the following tokens
+        self._full_at = full_at + self._interval
+        wait_time = available_at - now
+        if wait_time > 0:
+            try:
+                await asyncio.sleep(wait_time)
+            except asyncio.CancelledError:
+                # a cancelled caller does not use its token, give it back
+                self._full_at -= self._interval
+                raise
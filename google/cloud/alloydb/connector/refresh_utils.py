@@ -15,10 +15,14 @@
 from __future__ import annotations
 
 import asyncio
+import base64
 from datetime import datetime
 from datetime import timezone
+from functools import lru_cache
 import logging
 
+from cryptography import x509
+
 logger = logging.getLogger(name=__name__)
 
 # _refresh_buffer is the amount of time before a refresh's result expires
@@ -60,3 +64,88 @@ async def _is_valid(task: asyncio.Task) -> bool:
         # suppress any errors from task
         logger.debug("Current refresh result is invalid.")
     return False
+
+
+def _read_der_header(der: bytes, offset: int) -> tuple[int, int, int]:
+    """
+    Reads the tag and length of the DER element starting at offset.
+
+    Returns:
+        tuple[int, int, int]: The element's tag and the offsets of the start
+            and end of its contents.
+    """
+    tag = der[offset]
+    length = der[offset + 1]
+    offset += 2
+    # long form length, the low bits give the number of length bytes
+    if length & 0x80:
+        num_bytes = length & 0x7F
+        length = int.from_bytes(der[offset : offset + num_bytes], "big")
+        offset += num_bytes
+    return tag, offset, offset + length
+
+
+def _parse_not_after(der: bytes) -> datetime:
+    """
+    Walks the DER encoded certificate to its validity notAfter field,
+    skipping the rest of the TBSCertificate.
+    """
+    # Certificate ::= SEQUENCE { tbsCertificate, ... }
+    tag, start, _ = _read_der_header(der, 0)
+    if tag != 0x30:
+        raise ValueError("Certificate is not a DER SEQUENCE.")
+    # TBSCertificate ::= SEQUENCE { [0] version OPTIONAL, serialNumber,
+    #   signature, issuer, validity, ... }
+    tag, offset, _ = _read_der_header(der, start)
+    if tag != 0x30:
+        raise ValueError("TBSCertificate is not a DER SEQUENCE.")
+    tag, _, end = _read_der_header(der, offset)
+    # skip explicitly tagged version
+    if tag == 0xA0:
+        offset = end
+    # skip serialNumber, signature and issuer
+    for expected_tag in (0x02, 0x30, 0x30):
+        tag, _, offset = _read_der_header(der, offset)
+        if tag != expected_tag:
+            raise ValueError("Unexpected TBSCertificate layout.")
+    # Validity ::= SEQUENCE { notBefore Time, notAfter Time }
+    tag, offset, _ = _read_der_header(der, offset)
+    if tag != 0x30:
+        raise ValueError("Validity is not a DER SEQUENCE.")
+    _, _, offset = _read_der_header(der, offset)
+    tag, start, end = _read_der_header(der, offset)
+    value = der[start:end].decode("ascii")
+    # UTCTime (YYMMDDHHMMSSZ), years 50-99 are 19YY per RFC 5280
+    if tag == 0x17 and len(value) == 13 and value.endswith("Z"):
+        year = int(value[:2])
+        year += 1900 if year >= 50 else 2000
+        value = f"{year}{value[2:]}"
+    # GeneralizedTime (YYYYMMDDHHMMSSZ)
+    elif tag != 0x18 or len(value) != 15 or not value.endswith("Z"):
+        raise ValueError("Unsupported notAfter time encoding.")
+    return datetime.strptime(value, "%Y%m%d%H%M%SZ").replace(tzinfo=timezone.utc)
+
+
+# the same client certificate is parsed again when its connection info is
+# refreshed concurrently or rebuilt, so cache the results
+@lru_cache(maxsize=32)
+def _get_expiration(cert: str) -> datetime:
+    """
+    Gets the expiration time of a PEM encoded certificate.
+
+    Reads only the validity field of the certificate rather than decoding the
+    full certificate, falling back to a full decode for unexpected encodings.
+
+    Args:
+        cert (str): PEM encoded certificate.
+    Returns:
+        datetime.datetime: Time of certificate expiration.
+    """
+    try:
+        body = "".join(
+            line for line in cert.strip().splitlines() if not line.startswith("-----")
+        )
+        return _parse_not_after(base64.b64decode(body))
+    except (IndexError, ValueError):
+        cert_obj = x509.load_pem_x509_certificate(cert.encode("UTF-8"))
+        return cert_obj.not_valid_after_utc
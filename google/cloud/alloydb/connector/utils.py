@@ -14,39 +14,69 @@
 
 from __future__ import annotations
 
-import aiofiles
+import asyncio
+from functools import lru_cache
+from functools import partial
+import os
+import threading
+from typing import Optional
+
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
 
+# client key pair shared by all connectors in the process, see _get_keys
+_keys: Optional[tuple[rsa.RSAPrivateKey, str]] = None
+_keys_lock = threading.Lock()
 
-async def _write_to_file(
-    dir_path: str, ca_cert: str, cert_chain: list[str], key: rsa.RSAPrivateKey
-) -> tuple[str, str, str]:
+
+# the private key is the same for every refresh, so its PEM encoding is cached
+# rather than serialized each time an SSL context is created
+@lru_cache(maxsize=4)
+def _private_key_pem(key: rsa.RSAPrivateKey) -> bytes:
     """
-    Helper function to write the server_ca, client certificate and
-    private key to .pem files in a given directory.
+    Returns the PEM encoding of the given private key.
     """
-    ca_filename = f"{dir_path}/ca.pem"
-    cert_chain_filename = f"{dir_path}/chain.pem"
-    key_filename = f"{dir_path}/priv.pem"
-
-    key_bytes = key.private_bytes(
+    return key.private_bytes(
         encoding=serialization.Encoding.PEM,
         format=serialization.PrivateFormat.TraditionalOpenSSL,
         encryption_algorithm=serialization.NoEncryption(),
     )
 
-    async with aiofiles.open(ca_filename, "w+") as ca_out:
-        await ca_out.write(ca_cert)
-    async with aiofiles.open(cert_chain_filename, "w+") as chain_out:
-        await chain_out.write("".join(cert_chain))
-    async with aiofiles.open(key_filename, "wb") as priv_out:
-        await priv_out.write(key_bytes)
 
-    return (ca_filename, cert_chain_filename, key_filename)
+async def _write_to_file(
+    dir_path: str, cert_chain: list[str], key: rsa.RSAPrivateKey
+) -> str:
+    """
+    Helper function to write the private key and client certificate chain
+    to a single .pem file in a given directory.
+    """
+    filename = f"{dir_path}/chain.pem"
+
+    # the key and chain share one file, which is written in a single call
+    pem = _private_key_pem(key) + "".join(cert_chain).encode()
+
+    # open, write and close the file in a single worker thread round trip
+    await asyncio.to_thread(_write_private_file, filename, pem)
 
+    return filename
 
-async def generate_keys() -> tuple[rsa.RSAPrivateKey, str]:
+
+def _write_private_file(filename: str, data: bytes) -> None:
+    """
+    Writes data to a new file that only the current user can read.
+    """
+    with open(filename, "wb", opener=partial(os.open, mode=0o600)) as out:
+        out.write(data)
+
+
+def _generate_keys() -> tuple[rsa.RSAPrivateKey, str]:
+    """
+    Generates the RSA key pair whose public key is signed by the AlloyDB API
+    to create the client certificate.
+
+    Key generation is comparatively expensive, so use _get_keys to share a
+    single key pair across the process instead of calling this directly.
+    """
     priv_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
     pub_key = (
         priv_key.public_key()
@@ -57,3 +87,26 @@ async def generate_keys() -> tuple[rsa.RSAPrivateKey, str]:
         .decode("UTF-8")
     )
     return (priv_key, pub_key)
+
+
+def _get_keys() -> tuple[rsa.RSAPrivateKey, str]:
+    """
+    Returns the client key pair shared by all connectors in the process,
+    generating it on first use.
+    """
+    global _keys
+    with _keys_lock:
+        if _keys is None:
+            _keys = _generate_keys()
+        return _keys
+
+
+async def generate_keys() -> tuple[rsa.RSAPrivateKey, str]:
+    """
+    Returns the shared client key pair, generating it on first use.
+
+    _get_keys runs in a worker thread so the event loop does not block on its
+    lock while another thread generates the keys. Key generation holds the
+    GIL, so the loop still stalls while the keys are generated.
+    """
+    return await asyncio.to_thread(_get_keys)
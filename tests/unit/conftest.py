@@ -55,19 +55,17 @@ async def start_proxy_server(instance: FakeInstance) -> None:
         root, _, server = instance.get_pem_certs()
         # tmpdir and its contents are automatically deleted after the CA cert
         # and cert chain are loaded into the SSLcontext. The values
-        # need to be written to files in order to be loaded by the SSLContext
+        # need to be written to a file in order to be loaded by the SSLContext
         async with TemporaryDirectory() as tmpdir:
-            _, cert_chain_filename, key_filename = await _write_to_file(
-                tmpdir, server, [server, root], instance.server_key
-            )
-            context.load_cert_chain(cert_chain_filename, key_filename)
+            filename = await _write_to_file(tmpdir, [server, root], instance.server_key)
+            context.load_cert_chain(filename)
         # bind socket to AlloyDB proxy server port on localhost
         sock.bind((ip_address, port))
         # listen for incoming connections
         sock.listen(5)
 
-        while True:
-            with context.wrap_socket(sock, server_side=True) as ssock:
+        with context.wrap_socket(sock, server_side=True) as ssock:
+            while True:
                 conn, _ = ssock.accept()
                 metadata_exchange(conn)
                 conn.sendall(instance.name.encode("utf-8"))
@@ -87,5 +85,5 @@ def proxy_server(fake_instance: FakeInstance) -> Generator:
         daemon=True,
     )
     thread.start()
+    # the server runs until the end of the session as a daemon thread
     yield thread
-    thread.join()
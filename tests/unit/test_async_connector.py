@@ -13,7 +13,8 @@
 # limitations under the License.
 
 import asyncio
-from typing import Union
+import time
+from typing import Any, Union
 
 from aiohttp import ClientResponseError
 from mock import patch
@@ -139,6 +140,35 @@ TEST_INSTANCE_NAME = "/".join(
 )
 
 
+@pytest.mark.asyncio
+async def test_connect_iam_authentication_token(
+    credentials: FakeCredentials,
+) -> None:
+    """
+    Test that the IAM authentication token callable refreshes credentials
+    without blocking and returns the token.
+    """
+    with patch("google.cloud.alloydb.connector.asyncpg.connect") as connect:
+        # patch db connection creation and return plain future
+        future = asyncio.Future()
+        future.set_result(True)
+        connect.return_value = future
+
+        connector = AsyncConnector(credentials, enable_iam_auth=True)
+        connector._client = FakeAlloyDBClient()
+        await connector.connect(
+            TEST_INSTANCE_NAME,
+            "asyncpg",
+            user="test-user",
+            db="test-db",
+        )
+        # asyncpg awaits the result of the password callable
+        get_authentication_token = connect.call_args.kwargs["password"]
+        credentials.token = None
+        assert await get_authentication_token() == "12345"
+        await connector.close()
+
+
 @pytest.mark.asyncio
 async def test_connect_and_close(credentials: FakeCredentials) -> None:
     """
@@ -216,6 +246,32 @@ async def test_close_stops_instance(credentials: FakeCredentials) -> None:
     assert fake._close_called is True
 
 
+@pytest.mark.asyncio
+async def test_close_with_failing_cache(credentials: FakeCredentials) -> None:
+    """
+    Test that a cache failing to close does not prevent the other caches or
+    the client from closing, and that its error is raised.
+    """
+    connector = AsyncConnector(credentials)
+    client = FakeAlloyDBClient()
+    connector._client = client
+    failing = FakeConnectionInfo()
+    fake = FakeConnectionInfo()
+
+    async def close() -> None:
+        raise RuntimeError("close failed")
+
+    failing.close = close
+    connector._cache["failing-instance"] = failing
+    connector._cache[TEST_INSTANCE_NAME] = fake
+
+    with pytest.raises(RuntimeError, match="close failed"):
+        await connector.close()
+
+    assert fake._close_called is True
+    assert client.closed is True
+
+
 @pytest.mark.asyncio
 async def test_context_manager_connect_and_close(
     credentials: FakeCredentials,
@@ -275,6 +331,14 @@ def test_synchronous_init(credentials: FakeCredentials) -> None:
     """
     connector = AsyncConnector(credentials)
     assert connector._keys is None
+    # keys are generated in a separate thread until an event loop is running
+    assert connector._keys_future is not None
+    priv_key, pub_key = connector._keys_future.result()
+    assert pub_key.startswith("-----BEGIN PUBLIC KEY-----")
+    # keys are shared by all connectors in the process
+    other = AsyncConnector(credentials)
+    assert other._keys_future is not None
+    assert other._keys_future.result() == (priv_key, pub_key)
 
 
 async def test_async_connect_bad_ip_type(
@@ -333,3 +397,74 @@ async def test_Connector_remove_cached_no_ip_type(credentials: FakeCredentials)
             await connector.connect(instance_uri, "asyncpg", ip_type="private")
         # check that cache has been removed from dict
         assert instance_uri not in connector._cache
+
+
+async def test_connect_unsupported_driver_does_not_init_client(
+    credentials: FakeCredentials,
+) -> None:
+    """
+    Test that an unsupported driver is rejected before the AlloyDBClient is
+    created, so the shared client is never bound to an unsupported driver.
+    """
+    async with AsyncConnector(credentials) as connector:
+        with pytest.raises(ValueError):
+            await connector.connect(TEST_INSTANCE_NAME, "bad_driver")
+        assert connector._client is None
+
+
+def test_connect_unsupported_driver_skips_credentials_and_keys() -> None:
+    """
+    Test that an unsupported driver is rejected before application default
+    credentials are looked up or keys are awaited on the loop.
+    """
+    with patch("google.auth.default") as mock_default:
+        connector = AsyncConnector()
+
+        async def connect_and_close() -> None:
+            with pytest.raises(ValueError):
+                await connector.connect(TEST_INSTANCE_NAME, "bad_driver")
+            assert connector._keys is None
+            await connector.close()
+
+        asyncio.run(connect_and_close())
+        mock_default.assert_not_called()
+
+
+async def test_AsyncConnector_default_credentials_resolved_lazily(
+    credentials: FakeCredentials,
+) -> None:
+    """
+    Test that application default credentials are not looked up until
+    they are first needed.
+    """
+    with patch("google.auth.default") as mock_default:
+        mock_default.return_value = (credentials, "my-project")
+        connector = AsyncConnector()
+        mock_default.assert_not_called()
+        assert await connector._resolve_credentials() == credentials
+        assert await connector._resolve_credentials() == credentials
+        mock_default.assert_called_once()
+        await connector.close()
+
+
+async def test_AsyncConnector_default_credentials_resolved_once(
+    credentials: FakeCredentials,
+) -> None:
+    """
+    Test that concurrent first connects share a single lookup of application
+    default credentials.
+    """
+
+    def slow_default(**kwargs: Any) -> tuple[FakeCredentials, str]:
+        time.sleep(0.1)
+        return (credentials, "my-project")
+
+    with patch("google.auth.default", side_effect=slow_default) as mock_default:
+        connector = AsyncConnector()
+        resolved = await asyncio.gather(
+            connector._resolve_credentials(), connector._resolve_credentials()
+        )
+        assert resolved == [credentials, credentials]
+        assert connector._credentials == credentials
+        mock_default.assert_called_once()
+        await connector.close()
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import json
 from typing import Any, Optional
 
@@ -19,6 +20,7 @@ from aiohttp import ClientResponseError
 from aiohttp import web
 from aioresponses import aioresponses
 from mocks import FakeCredentials
+from mocks import FakeInstance
 import pytest
 
 from google.cloud.alloydb.connector.client import AlloyDBClient
@@ -54,6 +56,8 @@ async def connectionInfoPsc(request: Any) -> web.Response:
 
 
 async def generateClientCertificate(request: Any) -> web.Response:
+    if request.content_type != "application/json":
+        return web.Response(status=415)
     response = {
         "caCert": "This is the CA cert",
         "pemCertificateChain": [
@@ -371,3 +375,97 @@ async def test_AlloyDBClient_use_metadata(
     assert client._use_metadata == expected
     # close client
     await client.close()
+
+
+async def test_get_connection_info(credentials: FakeCredentials) -> None:
+    """
+    Test that get_connection_info refreshes credentials once and returns
+    the instance metadata and certificates from the AlloyDB API.
+    """
+    instance = FakeInstance()
+    root_cert, intermediate_cert, server_cert = instance.get_pem_certs()
+    client = AlloyDBClient(
+        alloydb_api_endpoint="https://alloydb.googleapis.com",
+        quota_project=None,
+        credentials=credentials,
+    )
+    get_url = "https://alloydb.googleapis.com/v1beta/projects/my-project/locations/my-region/clusters/my-cluster/instances/my-instance/connectionInfo"
+    post_url = "https://alloydb.googleapis.com/v1beta/projects/my-project/locations/my-region/clusters/my-cluster:generateClientCertificate"
+    keys = asyncio.create_task(generate_keys())
+    with aioresponses() as mocked:
+        mocked.get(get_url, status=200, payload={"ipAddress": "10.0.0.1"})
+        mocked.post(
+            post_url,
+            status=200,
+            payload={
+                "caCert": server_cert,
+                "pemCertificateChain": [intermediate_cert, root_cert],
+            },
+        )
+        conn_info = await client.get_connection_info(
+            "my-project", "my-region", "my-cluster", "my-instance", keys
+        )
+    assert credentials.token == "12345"
+    assert conn_info.ip_addrs == {"PRIVATE": "10.0.0.1", "PUBLIC": None, "PSC": None}
+    assert conn_info.ca_cert == server_cert
+    assert conn_info.cert_chain == [intermediate_cert, root_cert]
+    assert conn_info.expiration == instance.intermediate_cert.not_valid_after_utc
+    await client.close()
+
+
+async def test_AlloyDBClient_authorization(credentials: FakeCredentials) -> None:
+    """
+    Test that the request headers are shared between requests and
+    track the credentials token.
+    """
+    client = AlloyDBClient("www.test-endpoint.com", "my-quota-project", credentials)
+    credentials.token = "first-token"
+    headers = client._headers()
+    assert headers == {
+        "Authorization": "Bearer first-token",
+        "Content-Type": "application/json",
+    }
+    assert client._headers() is headers
+    credentials.token = "second-token"
+    assert client._headers()["Authorization"] == "Bearer second-token"
+    await client.close()
+
+
+async def test_AlloyDBClient_client_cert_body(credentials: FakeCredentials) -> None:
+    """
+    Test that the generateClientCertificate body is cached per public key.
+    """
+    client = AlloyDBClient(
+        "www.test-endpoint.com", "my-quota-project", credentials, driver="pg8000"
+    )
+    body = client._client_cert_body("first-key")
+    assert json.loads(body) == {
+        "publicKey": "first-key",
+        "certDuration": "3600s",
+        "useMetadataExchange": True,
+    }
+    assert client._client_cert_body("first-key") is body
+    assert json.loads(client._client_cert_body("second-key"))["publicKey"] == (
+        "second-key"
+    )
+    await client.close()
+
+
+async def test_AlloyDBClient_refresh_credentials(credentials: FakeCredentials) -> None:
+    """
+    Test that concurrent credential refreshes share a single refresh.
+    """
+    client = AlloyDBClient("www.test-endpoint.com", "my-quota-project", credentials)
+    refresh = credentials.refresh
+    calls = 0
+
+    def counting_refresh(request: Any) -> None:
+        nonlocal calls
+        calls += 1
+        refresh(request)
+
+    credentials.refresh = counting_refresh
+    await asyncio.gather(*[client._refresh_credentials() for _ in range(5)])
+    assert calls == 1
+    assert credentials.token == "12345"
+    await client.close()
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
@@ -63,6 +64,25 @@ async def test_ConnectionInfo_init_(fake_instance: FakeInstance) -> None:
     assert context.minimum_version == ssl.TLSVersion.TLSv1_3
 
 
+async def test_ConnectionInfo_concurrent_create_ssl_context() -> None:
+    """
+    Test that concurrent calls to create_ssl_context share a single context.
+    """
+    info = ConnectionInfo(["cert"], "cert", "key", {}, datetime.now(timezone.utc))
+    builds = 0
+
+    async def build() -> str:
+        nonlocal builds
+        builds += 1
+        await asyncio.sleep(0)
+        return "context"
+
+    info._build_ssl_context = build
+    contexts = await asyncio.gather(*[info.create_ssl_context() for _ in range(5)])
+    assert contexts == ["context"] * 5
+    assert builds == 1
+
+
 async def test_ConnectionInfo_caches_sslcontext() -> None:
     info = ConnectionInfo(["cert"], "cert", "key".encode(), {}, datetime.now())
     # context should default to None
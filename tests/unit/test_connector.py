@@ -13,8 +13,10 @@
 # limitations under the License.
 
 import asyncio
+import socket
 from threading import Thread
-from typing import Union
+import time
+from typing import Any, Union
 
 from aiohttp import ClientResponseError
 from mock import patch
@@ -24,9 +26,18 @@ import pytest
 
 from google.cloud.alloydb.connector import Connector
 from google.cloud.alloydb.connector import IPTypes
+from google.cloud.alloydb.connector.client import AlloyDBClient
+from google.cloud.alloydb.connector.exceptions import ConnectorLoopError
 from google.cloud.alloydb.connector.exceptions import IPTypeNotFoundError
-from google.cloud.alloydb.connector.instance import RefreshAheadCache
-from google.cloud.alloydb.connector.utils import generate_keys
+
+
+def _replace_client(connector: Connector, client: FakeAlloyDBClient) -> None:
+    """Replaces the connector's eagerly initialized client with a fake."""
+    if connector._client is not None:
+        asyncio.run_coroutine_threadsafe(
+            connector._client.close(), connector._loop
+        ).result()
+    connector._client = client
 
 
 def test_Connector_init(credentials: FakeCredentials) -> None:
@@ -37,8 +48,11 @@ def test_Connector_init(credentials: FakeCredentials) -> None:
     connector = Connector(credentials)
     assert connector._quota_project is None
     assert connector._alloydb_api_endpoint == "https://alloydb.googleapis.com"
-    assert connector._client is None
+    # client is initialized eagerly as credentials are provided
+    assert isinstance(connector._client, AlloyDBClient)
     assert connector._credentials == credentials
+    # keys are only generated on first connect
+    assert connector._keys is None
     connector.close()
 
 
@@ -114,7 +128,7 @@ def test_Connector_context_manager(credentials: FakeCredentials) -> None:
     with Connector(credentials) as connector:
         assert connector._quota_project is None
         assert connector._alloydb_api_endpoint == "https://alloydb.googleapis.com"
-        assert connector._client is None
+        assert isinstance(connector._client, AlloyDBClient)
         assert connector._credentials == credentials
 
 
@@ -139,7 +153,7 @@ def test_connect(credentials: FakeCredentials, fake_client: FakeAlloyDBClient) -
     """
     client = fake_client
     with Connector(credentials) as connector:
-        connector._client = client
+        _replace_client(connector, client)
         # patch db connection creation
         with patch("google.cloud.alloydb.connector.pg8000.connect") as mock_connect:
             mock_connect.return_value = True
@@ -154,12 +168,56 @@ def test_connect(credentials: FakeCredentials, fake_client: FakeAlloyDBClient) -
         assert connection is True
 
 
+@pytest.mark.usefixtures("proxy_server")
+def test_connect_resumes_tls_session(
+    credentials: FakeCredentials, fake_client: FakeAlloyDBClient
+) -> None:
+    """
+    Test that connections to an instance resume the TLS session of a
+    previous connection.
+    """
+    with Connector(credentials) as connector:
+        _replace_client(connector, fake_client)
+        # patch db connection creation
+        with patch("google.cloud.alloydb.connector.pg8000.connect") as mock_connect:
+            mock_connect.return_value = True
+            for _ in range(2):
+                connector.connect(
+                    "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance",
+                    "pg8000",
+                    user="test-user",
+                    password="test-password",
+                    db="test-db",
+                )
+            first_sock, second_sock = [c.args[0] for c in mock_connect.call_args_list]
+        assert first_sock.session_reused is False
+        assert second_sock.session_reused is True
+        # sockets are tuned for small protocol messages
+        assert second_sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        assert second_sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+
+
+def test_metadata_exchange_request_reused(credentials: FakeCredentials) -> None:
+    """
+    Test that the serialized metadata exchange request is reused until the
+    token changes.
+    """
+    with Connector(credentials=credentials) as connector:
+        request = connector._metadata_exchange_request(False, "token")
+        # check that the request is length-prefixed
+        assert int.from_bytes(request[:4], "big") == len(request) - 4
+        assert connector._metadata_exchange_request(False, "token") is request
+        # check that the auth type and token are part of the cache key
+        assert connector._metadata_exchange_request(True, "token") != request
+        assert connector._metadata_exchange_request(False, "new-token") != request
+
+
 def test_connect_bad_ip_type(
     credentials: FakeCredentials, fake_client: FakeAlloyDBClient
 ) -> None:
     """Test that Connector.connect errors due to bad ip_type str."""
     with Connector(credentials=credentials) as connector:
-        connector._client = fake_client
+        _replace_client(connector, fake_client)
         bad_ip_type = "BAD-IP-TYPE"
         with pytest.raises(ValueError) as exc_info:
             connector.connect(
@@ -182,7 +240,7 @@ def test_connect_unsupported_driver(credentials: FakeCredentials) -> None:
     """
     client = FakeAlloyDBClient()
     with Connector(credentials) as connector:
-        connector._client = client
+        _replace_client(connector, client)
         # try to connect using unsupported driver, should raise ValueError
         with pytest.raises(ValueError) as exc_info:
             connector.connect(
@@ -196,6 +254,22 @@ def test_connect_unsupported_driver(credentials: FakeCredentials) -> None:
         )
 
 
+def test_connect_unsupported_driver_skips_credentials_and_keys() -> None:
+    """
+    Test that an unsupported driver is rejected before application default
+    credentials are looked up or keys are generated.
+    """
+    with patch("google.cloud.alloydb.connector.connector.default") as mock_default:
+        with Connector() as connector:
+            with pytest.raises(ValueError):
+                connector.connect(
+                    "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance",
+                    "bad_driver",
+                )
+            mock_default.assert_not_called()
+            assert connector._keys is None
+
+
 def test_Connector_close_called_multiple_times(credentials: FakeCredentials) -> None:
     """Test that Connector.close can be called multiple times."""
     # open and close Connector object
@@ -224,7 +298,7 @@ def test_Connector_remove_cached_bad_instance(
         assert instance_uri not in connector._cache
 
 
-async def test_Connector_remove_cached_no_ip_type(credentials: FakeCredentials) -> None:
+def test_Connector_remove_cached_no_ip_type(credentials: FakeCredentials) -> None:
     """When a Connector attempts to connect and preferred IP type is not present,
     it should delete the instance from the cache and ensure no background refresh
     happens (which would be wasted cycles).
@@ -234,17 +308,69 @@ async def test_Connector_remove_cached_no_ip_type(credentials: FakeCredentials)
     fake_client = FakeAlloyDBClient()
     fake_client.instance.ip_addrs = {"PUBLIC": "127.0.0.1"}
     with Connector(credentials=credentials) as connector:
-        connector._client = fake_client
-        connector._keys = asyncio.wrap_future(
-            asyncio.run_coroutine_threadsafe(
-                generate_keys(), asyncio.get_running_loop()
-            ),
-            loop=asyncio.get_running_loop(),
-        )
-        cache = RefreshAheadCache(instance_uri, fake_client, connector._keys)
-        connector._cache[instance_uri] = cache
+        _replace_client(connector, fake_client)
         # test instance does not have Private IP, thus should invalidate cache
         with pytest.raises(IPTypeNotFoundError):
-            await connector.connect_async(instance_uri, "pg8000", ip_type="private")
+            connector.connect(instance_uri, "pg8000", ip_type="private")
         # check that cache has been removed from dict
         assert instance_uri not in connector._cache
+
+
+async def test_connect_async_from_other_loop(credentials: FakeCredentials) -> None:
+    """
+    Test that connect_async errors when called from an event loop other than
+    the Connector's background event loop.
+    """
+    with Connector(credentials) as connector:
+        with pytest.raises(ConnectorLoopError):
+            await connector.connect_async(
+                "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance",
+                "pg8000",
+            )
+
+
+def test_Connector_default_credentials_resolved_lazily(
+    credentials: FakeCredentials,
+) -> None:
+    """
+    Test that application default credentials are not looked up until
+    they are first needed.
+    """
+    with patch("google.cloud.alloydb.connector.connector.default") as mock_default:
+        mock_default.return_value = (credentials, "my-project")
+        with Connector() as connector:
+            mock_default.assert_not_called()
+            resolved = asyncio.run_coroutine_threadsafe(
+                connector._resolve_credentials(), connector._loop
+            ).result()
+            assert resolved == credentials
+            mock_default.assert_called_once()
+
+
+def test_Connector_default_credentials_resolved_once(
+    credentials: FakeCredentials,
+) -> None:
+    """
+    Test that concurrent first connects share a single lookup of application
+    default credentials.
+    """
+
+    def slow_default(**kwargs: Any) -> tuple[FakeCredentials, str]:
+        time.sleep(0.1)
+        return (credentials, "my-project")
+
+    async def resolve_concurrently(connector: Connector) -> list:
+        return await asyncio.gather(
+            connector._resolve_credentials(), connector._resolve_credentials()
+        )
+
+    with patch(
+        "google.cloud.alloydb.connector.connector.default", side_effect=slow_default
+    ) as mock_default:
+        with Connector() as connector:
+            resolved = asyncio.run_coroutine_threadsafe(
+                resolve_concurrently(connector), connector._loop
+            ).result()
+            assert resolved == [credentials, credentials]
+            assert connector._credentials == credentials
+            mock_default.assert_called_once()
@@ -64,6 +64,18 @@ def test_parse_bad_instance_uri() -> None:
         _parse_instance_uri("test-project:test-instance")
 
 
+def test_parse_instance_uri_is_cached() -> None:
+    """
+    Test that repeated parsing of the same instance uri is served from cache.
+    """
+    instance_uri = "projects/cached-project/locations/test-region/clusters/test-cluster/instances/test-instance"
+    expected = ("cached-project", "test-region", "test-cluster", "test-instance")
+    assert _parse_instance_uri(instance_uri) == expected
+    hits = _parse_instance_uri.cache_info().hits
+    assert _parse_instance_uri(instance_uri) == expected
+    assert _parse_instance_uri.cache_info().hits == hits + 1
+
+
 @pytest.mark.asyncio
 async def test_RefreshAheadCache_init() -> None:
     """
@@ -83,6 +95,7 @@ async def test_RefreshAheadCache_init() -> None:
             and cache._cluster == "test-cluster"
             and cache._name == "test-instance"
         )
+        await cache.close()
 
 
 @pytest.mark.asyncio
@@ -237,7 +250,7 @@ async def test_force_refresh_cancels_pending_refresh() -> None:
     # since the pending refresh isn't for another ~56 min, the refresh_in_progress event
     # shouldn't be set
     pending_refresh = cache._next
-    assert cache._refresh_in_progress.is_set() is False
+    assert cache._refresh_in_progress is False
     await cache.force_refresh()
     # pending_refresh has to be awaited for it to raised as cancelled
     with pytest.raises(asyncio.CancelledError):
@@ -247,3 +260,51 @@ async def test_force_refresh_cancels_pending_refresh() -> None:
     assert isinstance(await cache._current, ConnectionInfo)
     # close instance
     await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_force_refresh_shares_scheduled_refresh() -> None:
+    """
+    Test that concurrent force_refresh calls share a single refresh.
+    """
+    keys = asyncio.create_task(generate_keys())
+    client = FakeAlloyDBClient()
+    cache = RefreshAheadCache(
+        "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance",
+        client,
+        keys,
+    )
+    # make sure initial refresh is finished
+    await cache._current
+    await cache.force_refresh()
+    scheduled_refresh = cache._next
+    await asyncio.gather(cache.force_refresh(), cache.force_refresh())
+    # the immediate refresh was not cancelled and rescheduled
+    assert cache._next is scheduled_refresh
+    assert isinstance(await scheduled_refresh, ConnectionInfo)
+    # close instance
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_connect_info_cancellation_keeps_refresh() -> None:
+    """
+    Test that cancelling a connect_info call does not cancel the refresh.
+    """
+    keys = asyncio.create_task(generate_keys())
+    client = FakeAlloyDBClient()
+    cache = RefreshAheadCache(
+        "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance",
+        client,
+        keys,
+    )
+    task = asyncio.create_task(cache.connect_info())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    # the initial refresh still completes for later connection attempts
+    assert cache._current.cancelled() is False
+    assert isinstance(await cache.connect_info(), ConnectionInfo)
+    # close instance
+    await cache.close()
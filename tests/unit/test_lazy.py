@@ -17,6 +17,7 @@ import asyncio
 from google.cloud.alloydb.connector.client import AlloyDBClient
 from google.cloud.alloydb.connector.connection_info import ConnectionInfo
 from google.cloud.alloydb.connector.lazy import LazyRefreshCache
+from google.cloud.alloydb.connector.refresh_utils import _refresh_buffer
 from google.cloud.alloydb.connector.utils import generate_keys
 
 
@@ -60,3 +61,48 @@ async def test_LazyRefreshCache_force_refresh(fake_client: AlloyDBClient) -> Non
     assert conn_info2 != conn_info
     assert cache._cached == conn_info2
     await cache.close()
+
+
+async def test_LazyRefreshCache_concurrent_connect_info(
+    fake_client: AlloyDBClient,
+) -> None:
+    """
+    Test that concurrent LazyRefreshCache.connect_info calls share a refresh.
+    """
+    keys = asyncio.create_task(generate_keys())
+    cache = LazyRefreshCache(
+        "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance",
+        client=fake_client,
+        keys=keys,
+    )
+    conn_infos = await asyncio.gather(*(cache.connect_info() for _ in range(5)))
+    # check that every caller got the same connection info
+    assert all(conn_info is cache._cached for conn_info in conn_infos)
+    # check that cached connection info is returned without the lock
+    await cache._lock.acquire()
+    try:
+        assert await cache.connect_info() is cache._cached
+    finally:
+        cache._lock.release()
+
+
+async def test_LazyRefreshCache_refreshes_before_expiration(
+    fake_client: AlloyDBClient,
+) -> None:
+    """
+    Test that LazyRefreshCache refreshes once the refresh buffer is reached.
+    """
+    keys = asyncio.create_task(generate_keys())
+    cache = LazyRefreshCache(
+        "projects/test-project/locations/test-region/clusters/test-cluster/instances/test-instance",
+        client=fake_client,
+        keys=keys,
+    )
+    conn_info = await cache.connect_info()
+    # check that the refresh is due the refresh buffer before expiration
+    assert cache._refresh_at == conn_info.expiration.timestamp() - _refresh_buffer
+    # move the refresh deadline into the past
+    cache._refresh_at = 0.0
+    conn_info2 = await cache.connect_info()
+    # check that new connection info was retrieved
+    assert conn_info2 != conn_info
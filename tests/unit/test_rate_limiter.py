@@ -68,3 +68,48 @@ async def test_rate_limiter_completes_all_tasks() -> None:
     assert counter == 5
     assert len(done) == 5
     assert len(pending) == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_reserves_tokens_concurrently() -> None:
+    """Test to check waiting requests reserve their tokens without blocking."""
+    rate_limiter = AsyncRateLimiter(max_capacity=1, rate=1 / 10)
+    start = asyncio.get_running_loop().time()
+
+    # create 3 tasks waiting on the rate limiter
+    tasks = [asyncio.create_task(rate_limiter.acquire()) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    # verify every task reserved a token without waiting on the others
+    assert rate_limiter._full_at >= start + 3 * 10
+
+    # cleanup tasks
+    for task in tasks:
+        task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_cancelled_request_releases_token() -> None:
+    """Test to check a cancelled request gives back its reserved token."""
+    rate_limiter = AsyncRateLimiter(max_capacity=1, rate=1 / 10)
+    await rate_limiter.acquire()
+    full_at = rate_limiter._full_at
+
+    # create a task waiting on the rate limiter and cancel it
+    task = asyncio.create_task(rate_limiter.acquire())
+    await asyncio.sleep(0)
+    assert rate_limiter._full_at == full_at + 10
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # verify the next request is not delayed by the cancelled one
+    assert rate_limiter._full_at == full_at
+
+
+def test_rate_limiter_init_without_running_loop() -> None:
+    """Test to check the rate limiter can be created outside of a loop."""
+    rate_limiter = AsyncRateLimiter(max_capacity=1, rate=1)
+
+    # verify a token is available on the loop the limiter is used on
+    asyncio.run(asyncio.wait_for(rate_limiter.acquire(), timeout=1))
@@ -16,8 +16,12 @@ from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
 
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives import serialization
+from mocks import generate_cert
 import pytest
 
+from google.cloud.alloydb.connector.refresh_utils import _get_expiration
 from google.cloud.alloydb.connector.refresh_utils import _seconds_until_refresh
 
 
@@ -60,3 +64,35 @@ def test_seconds_until_refresh_under_4_mins() -> None:
     assert (
         _seconds_until_refresh(datetime.now(timezone.utc) + timedelta(minutes=3)) == 0
     )
+
+
+@pytest.mark.parametrize(
+    "expires_in",
+    [
+        # UTCTime encoded expiration
+        60,
+        # GeneralizedTime encoded expiration (year 2050 and later)
+        60 * 24 * 365 * 40,
+    ],
+)
+def test_get_expiration(expires_in: int) -> None:
+    """
+    Test _get_expiration returns the same expiration as a full
+    certificate decode.
+    """
+    cert, key = generate_cert("client.alloydb", expires_in=expires_in)
+    cert = cert.sign(key, hashes.SHA256())
+    pem = cert.public_bytes(encoding=serialization.Encoding.PEM).decode("UTF-8")
+    assert _get_expiration(pem) == cert.not_valid_after_utc
+    # repeated lookups for the same certificate are served from cache
+    hits = _get_expiration.cache_info().hits
+    assert _get_expiration(pem) == cert.not_valid_after_utc
+    assert _get_expiration.cache_info().hits == hits + 1
+
+
+def test_get_expiration_invalid_cert() -> None:
+    """
+    Test _get_expiration raises ValueError for invalid certificates.
+    """
+    with pytest.raises(ValueError):
+        _get_expiration("-----BEGIN CERTIFICATE-----\nbm90IGEgY2VydA==\n")